@@ -1,12 +1,21 @@
 import os
 import re
+import sys
 import csv
-import shutil
+import json
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 
 # --- CONFIGURATION ---
 MASTER_CSV_NAME = "master_parts.csv"
+PARALLEL_MIN_SHEETS = 4  # Parse sheets in worker processes from this many sheets up
+SHEET_CACHE_NAME = ".update_parts_cache.json"  # Parsed sheet components, reused while unchanged
+SHEET_CACHE_VERSION = 1  # Bump when parse_schematic_file output changes
+INTERN_MAX_LEN = 32  # Property values shorter than this are interned while parsing
 FIELDS_TO_EXTRACT = {
 	"MPN": "MPN",
 	"Mouser": "Mouser PN",
@@ -17,8 +26,64 @@ FIELDS_TO_EXTRACT = {
 	"Description": "Description"
 }
 
+# Schematic property names, resolved once from FIELDS_TO_EXTRACT
+_MPN_KEY = FIELDS_TO_EXTRACT["MPN"]
+_PART_FIELD_KEYS = tuple(FIELDS_TO_EXTRACT[name] for name in ("Mouser", "Digikey", "Manufacturer", "Tolerance", "Extra", "Description"))
+
+# Master list fields filled from a project only when blank in the master
+FILL_IF_BLANK = ('Mouser PN', 'Digikey PN', 'Voltage', 'Tolerance', 'Manufacturer', 'Datasheet', 'Extra')
+# Master list fields always replaced by the newest non-empty project value
+ALWAYS_UPDATE = ('Description', 'Symbol')
+
 # Component types where we should parse and normalize values
-VALUE_PARSE_TYPES = {'R', 'C', 'L', 'D', 'BT', 'F', 'FB', 'Y', 'Z'}
+VALUE_PARSE_TYPES = frozenset({'R', 'C', 'L', 'D', 'BT', 'F', 'FB', 'Y', 'Z'})
+
+# Units stripped from the end of a value (e.g., 10uF -> 10u)
+UNITS_TO_STRIP = ['Ω', 'Ohm', 'ohms', 'ohm', 'F', 'uF', 'nF', 'pF', 'H', 'uH', 'nH', 'mH', 'Hz', 'kHz', 'MHz']
+
+# Precompiled patterns for value parsing
+_VOLTAGE_RE = re.compile(r'\s*(\d+\.?\d*V)\s*')
+_WS_RE = re.compile(r'\s+')
+# Lowercase unit suffixes, shortest first so the shortest unit is stripped (10uF -> 10u, not 10)
+_UNIT_SUFFIXES = tuple(sorted(dict.fromkeys(u.lower() for u in UNITS_TO_STRIP), key=len))
+_FMT2_RE = re.compile(r'^(\d+)([pnuµmkKMG])(\d+)$')
+_FMT_R_RE = re.compile(r'^(\d+)R(\d*)$', re.IGNORECASE)
+# All value formats accepted by normalize_value, dispatched on the last matched group
+_NORM_RE = re.compile(
+	r'^(?:(?P<num>\d+\.?\d*)(?P<mult>[pnuµmkKMG])'
+	r'|(?P<main>\d+)(?P<mid_mult>[pnuµmkKMG])(?P<dec>\d+)'
+	r'|(?P<r_main>\d+)[Rr](?P<r_dec>\d*)'
+	r'|(?P<plain>\d+\.?\d*))$'
+)
+# Multiplier spellings normalized for consistency (µ -> u, K -> k)
+_MULT_CANON = {'µ': 'u', 'K': 'k'}
+# Multipliers with their numeric values
+_MULTIPLIERS = {
+	'p': 1e-12,
+	'n': 1e-9,
+	'u': 1e-6,
+	'µ': 1e-6,
+	'm': 1e-3,
+	'k': 1e3,
+	'K': 1e3,
+	'M': 1e6,
+	'G': 1e9
+}
+_FLOAT_RE = re.compile(r'^([0-9\.]+)([pnuµmkKMG]?)$')
+_VOLT_NUM_RE = re.compile(r'([0-9\.]+)')
+
+# Tokens for a single pass over schematic S-expressions
+# All '(' tokens share one prefix, so most positions cost a single literal check
+_TOKEN_RE = re.compile(
+	r'\((?:'
+	r'(?P<symbol>symbol\b)'
+	r'|property\s+"(?P<key>[^"]+)"\s+"(?P<value>(?:[^"\\]|\\.)*)"'
+	r'|lib_id\s+"(?P<lib_id>[^"]+)"'
+	r'|(?P<exclude>dnp\s+yes\)|in_bom\s+no\)|on_board\s+no\))'
+	r'|(?P<open>))'
+	r'|(?P<close>\))'
+	r'|"(?:[^"\\]|\\.)*"'
+)
 
 def clean_field_value(value):
 	"""Treat ~ or - as empty field values (KiCad placeholders)"""
@@ -33,15 +98,14 @@ def extract_voltage(value_str):
 		return value_str, ""
 
 	# Look for voltage patterns: number followed by V (possibly with decimal)
-	voltage_pattern = r'\s*(\d+\.?\d*V)\s*'
-	match = re.search(voltage_pattern, value_str)
+	match = _VOLTAGE_RE.search(value_str)
 
 	if match:
 		voltage = match.group(1)
 		# Remove the voltage from the value string
-		cleaned_value = re.sub(voltage_pattern, ' ', value_str).strip()
+		cleaned_value = _VOLTAGE_RE.sub(' ', value_str).strip()
 		# Clean up multiple spaces
-		cleaned_value = re.sub(r'\s+', ' ', cleaned_value)
+		cleaned_value = _WS_RE.sub(' ', cleaned_value)
 		return cleaned_value, voltage
 
 	return value_str, ""
@@ -52,7 +116,7 @@ def normalize_value(value_str, component_type):
 		return value_str
 
 	# First, clean up extra spaces
-	value_str = re.sub(r'\s+', ' ', value_str.strip())
+	value_str = _WS_RE.sub(' ', value_str.strip())
 
 	# Split off any suffix text (like X7R, 1%, etc.)
 	parts = value_str.split()
@@ -62,71 +126,41 @@ def normalize_value(value_str, component_type):
 	numeric_part = parts[0]
 	suffix = ' '.join(parts[1:]) if len(parts) > 1 else ""
 
-	# Define multipliers
-	multipliers = {
-		'p': (1e-12, 'p'),
-		'n': (1e-9, 'n'),
-		'u': (1e-6, 'u'),
-		'µ': (1e-6, 'u'),  # Convert µ to u for consistency
-		'm': (1e-3, 'm'),
-		'k': (1e3, 'k'),
-		'K': (1e3, 'k'),
-		'M': (1e6, 'M'),
-		'G': (1e9, 'G')
-	}
-
-	# Units to strip
-	units_to_strip = ['Ω', 'Ohm', 'ohms', 'ohm', 'F', 'uF', 'nF', 'pF', 'H', 'uH', 'nH', 'mH', 'Hz', 'kHz', 'MHz']
-
 	# Remove units from the numeric part
 	working_str = numeric_part
-	for unit in units_to_strip:
-		working_str = re.sub(re.escape(unit) + r'$', '', working_str, flags=re.IGNORECASE)
-
-	# Try to parse and normalize
-	# Format 1: 10k, 4.7u, etc. (number followed by multiplier)
-	match1 = re.match(r'^(\d+\.?\d*)([pnuµmkKMG])$', working_str)
-	if match1:
-		num, mult = match1.groups()
-		if mult == 'µ':
-			mult = 'u'
-		elif mult == 'K':
-			mult = 'k'
-		normalized = f"{num}{mult}"
-		return f"{normalized} {suffix}".strip() if suffix else normalized
-
-	# Format 2: 4k7, 1M2, etc. (number, multiplier, number)
-	match2 = re.match(r'^(\d+)([pnuµmkKMG])(\d+)$', working_str)
-	if match2:
-		main, mult, dec = match2.groups()
-		if mult == 'µ':
-			mult = 'u'
-		elif mult == 'K':
-			mult = 'k'
-		# Convert to decimal format (4k7 -> 4.7k)
-		decimal_val = f"{main}.{dec}"
-		normalized = f"{decimal_val}{mult}"
-		return f"{normalized} {suffix}".strip() if suffix else normalized
-
-	# Format 3: Special resistor format like 5R or 2R2 (5 ohms, 2.2 ohms)
-	# Keep the R since it indicates the unit when there's no multiplier
-	match3 = re.match(r'^(\d+)R(\d*)$', working_str, re.IGNORECASE)
-	if match3:
-		main, dec = match3.groups()
-		if dec:
-			normalized = f"{main}.{dec}R"
-		else:
-			normalized = f"{main}R"
-		return f"{normalized} {suffix}".strip() if suffix else normalized
+	lowered = numeric_part.lower()
+	for unit in _UNIT_SUFFIXES:
+		if lowered.endswith(unit):
+			working_str = numeric_part[:-len(unit)]
+			break
+
+	match = _NORM_RE.match(working_str)
+	if not match:
+		# If we can't parse it, return original
+		return value_str
 
-	# Format 4: Just a number (no multiplier)
-	match4 = re.match(r'^(\d+\.?\d*)$', working_str)
-	if match4:
-		return f"{working_str} {suffix}".strip() if suffix else working_str
+	kind = match.lastgroup
+	if kind == 'mult':
+		# Format 1: 10k, 4.7u, etc. (number followed by multiplier)
+		mult = match.group('mult')
+		normalized = f"{match.group('num')}{_MULT_CANON.get(mult, mult)}"
+	elif kind == 'dec':
+		# Format 2: 4k7, 1M2, etc. (number, multiplier, number)
+		# Convert to decimal format (4k7 -> 4.7k)
+		mult = match.group('mid_mult')
+		normalized = f"{match.group('main')}.{match.group('dec')}{_MULT_CANON.get(mult, mult)}"
+	elif kind == 'r_dec':
+		# Format 3: Special resistor format like 5R or 2R2 (5 ohms, 2.2 ohms)
+		# Keep the R since it indicates the unit when there's no multiplier
+		main, dec = match.group('r_main', 'r_dec')
+		normalized = f"{main}.{dec}R" if dec else f"{main}R"
+	else:
+		# Format 4: Just a number (no multiplier)
+		normalized = working_str
 
-	# If we can't parse it, return original
-	return value_str
+	return f"{normalized} {suffix}".strip() if suffix else normalized
 
+@lru_cache(maxsize=4096)
 def parse_value_to_float(value_str):
 	"""Parses component value (e.g. 10k, 4.7u) to float for sorting."""
 	if not value_str:
@@ -135,45 +169,32 @@ def parse_value_to_float(value_str):
 	# Take just the first part (before any space)
 	s = value_str.split()[0]
 
-	# Define multipliers with their numeric values
-	multipliers = {
-		'p': 1e-12,
-		'n': 1e-9,
-		'u': 1e-6,
-		'µ': 1e-6,
-		'm': 1e-3,
-		'k': 1e3,
-		'K': 1e3,
-		'M': 1e6,
-		'G': 1e9
-	}
-
 	# Try format: "10k" or "4.7u"
-	match = re.match(r'^([0-9\.]+)([pnuµmkKMG]?)$', s)
+	match = _FLOAT_RE.match(s)
 	if match:
 		num, mult = match.groups()
 		try:
 			val = float(num)
-			if mult and mult in multipliers:
-				val *= multipliers[mult]
+			if mult and mult in _MULTIPLIERS:
+				val *= _MULTIPLIERS[mult]
 			return val
 		except ValueError:
 			pass
 
 	# Try format: "4k7" or "1M2"
-	match_mid = re.match(r'^(\d+)([pnuµmkKMG])(\d+)$', s)
+	match_mid = _FMT2_RE.match(s)
 	if match_mid:
 		main, mult, dec = match_mid.groups()
 		try:
 			val = float(f"{main}.{dec}")
-			if mult in multipliers:
-				val *= multipliers[mult]
+			if mult in _MULTIPLIERS:
+				val *= _MULTIPLIERS[mult]
 			return val
 		except ValueError:
 			pass
 
 	# Try format: "5R" or "2R2" (resistor format)
-	match_r = re.match(r'^(\d+)R(\d*)$', s, re.IGNORECASE)
+	match_r = _FMT_R_RE.match(s)
 	if match_r:
 		main, dec = match_r.groups()
 		try:
@@ -186,12 +207,13 @@ def parse_value_to_float(value_str):
 
 	return 0.0
 
+@lru_cache(maxsize=4096)
 def parse_voltage_to_float(volt_str):
 	"""Parses voltage string (e.g. 16V, 6.3V) to float for sorting."""
 	if not volt_str:
 		return 0.0
 	# Extract the first number found
-	match = re.search(r'([0-9\.]+)', volt_str)
+	match = _VOLT_NUM_RE.search(volt_str)
 	if match:
 		try:
 			return float(match.group(1))
@@ -212,74 +234,97 @@ def strip_designator_suffix(refdes):
 
 def get_balanced_block(text, start_index):
 	"""Find the closing parenthesis for an S-expression block"""
+	# Jump between '(', ')' and '"' with str.find instead of visiting every character
+	find = text.find
 	depth = 0
-	in_string = False
-	for i in range(start_index, len(text)):
-		char = text[i]
-		if char == '"' and (i == 0 or text[i-1] != '\\'):
-			in_string = not in_string
-			continue
-		if in_string:
-			continue
-		if char == '(':
+	next_open = find('(', start_index)
+	next_close = find(')', start_index)
+	next_quote = find('"', start_index)
+	while next_close != -1:
+		if next_quote != -1 and next_quote < next_close and (next_open == -1 or next_quote < next_open):
+			# Escaped quote outside a string, ignore it
+			if next_quote > 0 and text[next_quote-1] == '\\':
+				next_quote = find('"', next_quote + 1)
+				continue
+
+			# Skip to the matching unescaped closing quote
+			end_quote = find('"', next_quote + 1)
+			while end_quote != -1 and text[end_quote-1] == '\\':
+				end_quote = find('"', end_quote + 1)
+			if end_quote == -1:
+				break
+
+			pos = end_quote + 1
+			if next_open < pos:
+				next_open = find('(', pos)
+			if next_close < pos:
+				next_close = find(')', pos)
+			next_quote = find('"', pos)
+		elif next_open != -1 and next_open < next_close:
 			depth += 1
-		elif char == ')':
+			next_open = find('(', next_open + 1)
+		else:
 			depth -= 1
 			if depth == 0:
-				return i
+				return next_close
+			next_close = find(')', next_close + 1)
 	return len(text)
 
-def should_exclude_component(block_text):
-	"""Check if component should be excluded (DNP, not in BOM, not on board)"""
-	# Check for (dnp yes)
-	if re.search(r'\(dnp\s+yes\)', block_text):
-		return True
-
-	# Check for (in_bom no)
-	if re.search(r'\(in_bom\s+no\)', block_text):
-		return True
-
-	# Check for (on_board no)
-	if re.search(r'\(on_board\s+no\)', block_text):
-		return True
-
-	return False
-
-def extract_lib_id(block_text):
-	"""Extract the lib_id (symbol) from the component block"""
-	match = re.search(r'\(lib_id\s+"([^"]+)"', block_text)
-	return match.group(1) if match else ""
-
 def parse_schematic_file(filepath):
 	"""Parses KiCad 9 S-expressions, skipping library definitions."""
-	with open(filepath, 'r', encoding='utf-8') as f:
-		content = f.read()
+	# Unbuffered binary read sizes one allocation from the file size, then decode once
+	with open(filepath, 'rb', buffering=0) as f:
+		content = f.read().decode('utf-8')
 
 	components = {}
 
-	# Remove (lib_symbols ...) block
+	# Skip the (lib_symbols ...) block by scanning around it, without copying the text
 	lib_sym_start = content.find('(lib_symbols')
 	if lib_sym_start != -1:
 		lib_sym_end = get_balanced_block(content, lib_sym_start)
-		content = content[:lib_sym_start] + content[lib_sym_end+1:]
-
-	# Find instance blocks
-	symbol_indices = [m.start() for m in re.finditer(r'\(symbol', content)]
-
-	for start_idx in symbol_indices:
-		end_idx = get_balanced_block(content, start_idx)
-		block_text = content[start_idx : end_idx+1]
+		tokens = chain(_TOKEN_RE.finditer(content, 0, lib_sym_start), _TOKEN_RE.finditer(content, lib_sym_end+1))
+	else:
+		tokens = _TOKEN_RE.finditer(content)
 
-		if '(lib_id' not in block_text:
+	# Walk all tokens once, collecting properties for each open symbol block
+	intern = sys.intern
+	depth = 0
+	open_symbols = []
+	for match in tokens:
+		kind = match.lastgroup
+		if kind == 'close':
+			depth -= 1
+			if not open_symbols or open_symbols[-1]['depth'] <= depth:
+				continue
+			symbol = open_symbols.pop()
+		elif kind is None:
+			# Quoted string, nothing to track
 			continue
-
-		# Check if component should be excluded
-		if should_exclude_component(block_text):
+		elif kind == 'exclude':
+			# Component should be excluded (DNP, not in BOM, not on board)
+			if open_symbols:
+				open_symbols[-1]['exclude'] = True
+			continue
+		else:
+			depth += 1
+			if kind == 'symbol':
+				open_symbols.append({"depth": depth, "props": {}, "lib_id": None, "exclude": False})
+			elif open_symbols:
+				if kind == 'value':
+					# Property names and short values repeat for every symbol, intern them
+					key, value = match.group('key', 'value')
+					if len(value) < INTERN_MAX_LEN:
+						value = intern(value)
+					open_symbols[-1]['props'][intern(key)] = value
+				elif kind == 'lib_id':
+					open_symbols[-1]['lib_id'] = match.group('lib_id')
 			continue
 
-		props_list = re.findall(r'\(property\s+"([^"]+)"\s+"((?:[^"\\]|\\.)*)"', block_text)
-		props = {k: v for k, v in props_list}
+		# A symbol block just closed, keep it if it is a placed component
+		if symbol['lib_id'] is None or symbol['exclude']:
+			continue
 
+		props = symbol['props']
 		refdes = props.get("Reference", "")
 		if not refdes:
 			continue
@@ -288,9 +333,8 @@ def parse_schematic_file(filepath):
 		if refdes.startswith("#"):
 			continue
 
-		# Extract lib_id (symbol)
-		lib_id = extract_lib_id(block_text)
-		props["_lib_id"] = lib_id
+		# Store lib_id (symbol)
+		props["_lib_id"] = symbol['lib_id']
 
 		# Deduplicate multi-unit parts (U1A, U1B -> U1)
 		base_refdes = strip_designator_suffix(refdes)
@@ -299,29 +343,82 @@ def parse_schematic_file(filepath):
 
 	return list(components.values())
 
-def scan_project_folder(folder_path):
+def load_sheet_cache(cache_path):
+	"""Load cached sheet components, keyed by absolute sheet path"""
+	if not cache_path or not os.path.exists(cache_path):
+		return {}
+	try:
+		with open(cache_path, 'r', encoding='utf-8') as f:
+			cache = json.load(f)
+	except (OSError, ValueError):
+		return {}
+	# Results from an older parser may differ, start over
+	if cache.get("version") != SHEET_CACHE_VERSION:
+		return {}
+	return cache.get("sheets", {})
+
+def save_sheet_cache(cache_path, sheets):
+	"""Save parsed sheet components for reuse on the next run"""
+	try:
+		with open(cache_path, 'w', encoding='utf-8') as f:
+			json.dump({"version": SHEET_CACHE_VERSION, "sheets": sheets}, f)
+	except OSError:
+		print(f"WARNING: Could not write sheet cache '{cache_path}'")
+
+def scan_project_folder(folder_path, cache_path=None):
 	project_name = os.path.basename(os.path.normpath(folder_path))
 	extracted_parts = {}
 
-	# Track the newest file date in the project
-	latest_mod_time = 0.0
-
-	sch_files = [f for f in os.listdir(folder_path) if f.endswith('.kicad_sch')]
-	print(f"Scanning project '{project_name}' ({len(sch_files)} sheets found)...")
+	# scandir entries carry their path and cache stat results
+	with os.scandir(folder_path) as it:
+		sch_entries = [entry for entry in it if entry.name.endswith('.kicad_sch')]
+	print(f"Scanning project '{project_name}' ({len(sch_entries)} sheets found)...")
 
-	for sch_file in sch_files:
-		path = os.path.join(folder_path, sch_file)
-
-		# Check file modification time
-		mtime = os.path.getmtime(path)
-		if mtime > latest_mod_time:
-			latest_mod_time = mtime
+	# Track the newest file date in the project
+	latest_mod_time = max((entry.stat().st_mtime for entry in sch_entries), default=0.0)
+
+	# Format date from file timestamp
+	date_str = datetime.fromtimestamp(latest_mod_time).strftime("%Y-%m-%d") if latest_mod_time > 0 else datetime.now().strftime("%Y-%m-%d")
+
+	# Reuse components from sheets unchanged since the last run
+	sheet_cache = load_sheet_cache(cache_path)
+	sheet_components = [None] * len(sch_entries)
+	stale_sheets = []
+	for i, entry in enumerate(sch_entries):
+		stat = entry.stat()
+		cached = sheet_cache.get(os.path.abspath(entry.path))
+		if cached and cached["mtime"] == stat.st_mtime and cached["size"] == stat.st_size:
+			sheet_components[i] = cached["components"]
+		else:
+			stale_sheets.append(i)
 
-		found_components = parse_schematic_file(path)
+	if len(stale_sheets) < len(sch_entries):
+		print(f"  Reusing cached results for {len(sch_entries) - len(stale_sheets)} unchanged sheets")
 
+	# Sheets are independent, so parse larger projects across all cores
+	stale_paths = [sch_entries[i].path for i in stale_sheets]
+	if len(stale_paths) < PARALLEL_MIN_SHEETS:
+		parsed_sheets = [parse_schematic_file(path) for path in stale_paths]
+	else:
+		with ProcessPoolExecutor() as executor:
+			parsed_sheets = list(executor.map(parse_schematic_file, stale_paths))
+
+	for i, components in zip(stale_sheets, parsed_sheets):
+		sheet_components[i] = components
+		stat = sch_entries[i].stat()
+		sheet_cache[os.path.abspath(sch_entries[i].path)] = {
+			"mtime": stat.st_mtime,
+			"size": stat.st_size,
+			"components": components
+		}
+
+	if cache_path and stale_sheets:
+		save_sheet_cache(cache_path, sheet_cache)
+
+	for found_components in sheet_components:
 		for props in found_components:
 			refdes = props.get("Reference", "")
-			mpn = clean_field_value(props.get(FIELDS_TO_EXTRACT["MPN"], ""))
+			mpn = clean_field_value(props.get(_MPN_KEY, ""))
 
 			if not mpn:
 				continue
@@ -329,14 +426,11 @@ def scan_project_folder(folder_path):
 			val = clean_field_value(props.get("Value", ""))
 			voltage = clean_field_value(props.get("Voltage", ""))
 			footprint = clean_field_value(props.get("Footprint", ""))
-			mouser = clean_field_value(props.get(FIELDS_TO_EXTRACT["Mouser"], ""))
-			digikey = clean_field_value(props.get(FIELDS_TO_EXTRACT["Digikey"], ""))
-			manufacturer = clean_field_value(props.get(FIELDS_TO_EXTRACT["Manufacturer"], ""))
-			tolerance = clean_field_value(props.get(FIELDS_TO_EXTRACT["Tolerance"], ""))
-			extra = clean_field_value(props.get(FIELDS_TO_EXTRACT["Extra"], ""))
+			mouser, digikey, manufacturer, tolerance, extra, description = [
+				clean_field_value(props.get(key, "")) for key in _PART_FIELD_KEYS
+			]
 
 			# Extract new fields
-			description = clean_field_value(props.get(FIELDS_TO_EXTRACT["Description"], ""))
 			symbol = clean_field_value(props.get("_lib_id", ""))
 			datasheet = clean_field_value(props.get("Datasheet", ""))
 
@@ -348,7 +442,8 @@ def scan_project_folder(folder_path):
 			comp_type = get_designator_type(refdes)
 
 			# Process value and voltage for applicable component types
-			if comp_type in VALUE_PARSE_TYPES:
+			is_parseable = comp_type in VALUE_PARSE_TYPES
+			if is_parseable:
 				# If Voltage property is not set, try to extract from Value
 				if not voltage and val:
 					val, extracted_voltage = extract_voltage(val)
@@ -361,8 +456,11 @@ def scan_project_folder(folder_path):
 				# Normalize the value format
 				val = normalize_value(val, comp_type)
 
-			# Format date from file timestamp
-			date_str = datetime.fromtimestamp(latest_mod_time).strftime("%Y-%m-%d") if latest_mod_time > 0 else datetime.now().strftime("%Y-%m-%d")
+			# Types, values and footprints repeat across many parts, share one copy of each
+			comp_type = sys.intern(comp_type)
+			val = sys.intern(val)
+			voltage = sys.intern(voltage)
+			footprint = sys.intern(footprint)
 
 			part_data = {
 				"Type": comp_type,
@@ -380,7 +478,8 @@ def scan_project_folder(folder_path):
 				"Symbol": symbol,
 				"Datasheet": datasheet,
 				"Projects": {project_name},
-				"Last Used": date_str
+				"Last Used": date_str,
+				"_is_parseable": is_parseable  # Internal, not written to the CSV
 			}
 
 			if mpn in extracted_parts:
@@ -401,28 +500,64 @@ def load_master_csv(filepath):
 		return parts
 
 	with open(filepath, 'r', newline='', encoding='utf-8') as csvfile:
-		reader = csv.DictReader(csvfile)
+		reader = csv.reader(csvfile)
+		header = next(reader, None)
+		if header is None:
+			return parts
+
+		# Column indices, last one wins for duplicate headers (as with DictReader)
+		columns = {name: i for i, name in enumerate(header)}
+		width = len(header)
+
+		i_type = columns['Type']
+		i_value = columns['Value']
+		i_footprint = columns['Footprint']
+		i_mpn = columns['MPN']
+		i_digikey = columns['Digikey PN']
+		i_mouser = columns['Mouser PN']
+		i_last_used = columns['Last Used']
+		i_used_in = columns['Used In']
+
+		# Optional columns (older master lists) point at an always-empty cell past the header
+		i_voltage = columns.get('Voltage', width)
+		i_tolerance = columns.get('Tolerance', width)
+		i_extra = columns.get('Extra', width)
+		i_stock = columns.get('Stock', width)
+		i_manufacturer = columns.get('Manufacturer', width)
+		i_description = columns.get('Description', width)
+		i_symbol = columns.get('Symbol', width)
+		i_datasheet = columns.get('Datasheet', width)
+
 		for row in reader:
-			mpn = row['MPN']
-			projs = set(row['Used In'].split(', ')) if row['Used In'] else set()
+			if not row:
+				continue
+			if len(row) != width:
+				# Pad short rows and drop extra cells so every column index is valid
+				row = (row + [''] * width)[:width]
+			row.append('')
+
+			mpn = row[i_mpn]
+			used_in = row[i_used_in]
+			projs = set(used_in.split(', ')) if used_in else set()
 
 			parts[mpn] = {
-				"Type": row['Type'],
-				"Value": row['Value'],
-				"Voltage": row.get('Voltage', ''),
-				"Tolerance": row.get('Tolerance', ''),
-				"Extra": row.get('Extra', ''),
-				"Footprint": row['Footprint'],
-				"Stock": row.get('Stock', ''),
-				"Manufacturer": row.get('Manufacturer', ''),
+				"Type": row[i_type],
+				"Value": row[i_value],
+				"Voltage": row[i_voltage],
+				"Tolerance": row[i_tolerance],
+				"Extra": row[i_extra],
+				"Footprint": row[i_footprint],
+				"Stock": row[i_stock],
+				"Manufacturer": row[i_manufacturer],
 				"MPN": mpn,
-				"Digikey PN": row['Digikey PN'],
-				"Mouser PN": row['Mouser PN'],
-				"Description": row.get('Description', ''),
-				"Symbol": row.get('Symbol', ''),
-				"Datasheet": row.get('Datasheet', ''),
+				"Digikey PN": row[i_digikey],
+				"Mouser PN": row[i_mouser],
+				"Description": row[i_description],
+				"Symbol": row[i_symbol],
+				"Datasheet": row[i_datasheet],
 				"Projects": projs,
-				"Last Used": row['Last Used']
+				"Last Used": row[i_last_used],
+				"_is_parseable": row[i_type] in VALUE_PARSE_TYPES  # Internal, not written to the CSV
 			}
 	return parts
 
@@ -438,52 +573,22 @@ def merge_data(master_data, new_data):
 				errors.append(f"CONFLICT: MPN {mpn} exists but specs differ!\n   Master: {existing['Value']} [{existing['Footprint']}]\n   New:    {new_part['Value']} [{new_part['Footprint']}]")
 				continue
 
-			updated = False
 			# Update blank fields (but preserve Stock manually entered)
-			if not existing['Mouser PN'] and new_part['Mouser PN']:
-				existing['Mouser PN'] = new_part['Mouser PN']
-				updated = True
-			if not existing['Digikey PN'] and new_part['Digikey PN']:
-				existing['Digikey PN'] = new_part['Digikey PN']
-				updated = True
-			if not existing['Voltage'] and new_part['Voltage']:
-				existing['Voltage'] = new_part['Voltage']
-				updated = True
-			if not existing['Tolerance'] and new_part['Tolerance']:
-				existing['Tolerance'] = new_part['Tolerance']
-				updated = True
-			if not existing['Manufacturer'] and new_part['Manufacturer']:
-				existing['Manufacturer'] = new_part['Manufacturer']
-				updated = True
-			if not existing['Datasheet'] and new_part['Datasheet']:
-				existing['Datasheet'] = new_part['Datasheet']
-				updated = True
-			if not existing['Extra'] and new_part['Extra']:
-				existing['Extra'] = new_part['Extra']
-				updated = True
+			fill = [k for k in FILL_IF_BLANK if not existing[k] and new_part[k]]
+			if fill:
+				existing.update({k: new_part[k] for k in fill})
+			updated = bool(fill)
 
 			# Always update Description and Symbol to newest (with warning if changed)
-			if existing['Description'] != new_part['Description'] and new_part['Description']:
-				if existing['Description']:
-					print(f"INFO: Updating description for {mpn}")
-					print(f"  > Old: {existing['Description']}")
-					print(f"  > New: {new_part['Description']}")
-				existing['Description'] = new_part['Description']
-				updated = True
-			elif not existing['Description'] and new_part['Description']:
-				existing['Description'] = new_part['Description']
-				updated = True
-
-			if existing['Symbol'] != new_part['Symbol'] and new_part['Symbol']:
-				if existing['Symbol']:
-					print(f"INFO: Updating symbol for {mpn}")
-					print(f"  > Old: {existing['Symbol']}")
-					print(f"  > New: {new_part['Symbol']}")
-				existing['Symbol'] = new_part['Symbol']
-				updated = True
-			elif not existing['Symbol'] and new_part['Symbol']:
-				existing['Symbol'] = new_part['Symbol']
-				updated = True
+			for k in ALWAYS_UPDATE:
+				new_value = new_part[k]
+				if new_value and existing[k] != new_value:
+					if existing[k]:
+						print(f"INFO: Updating {k.lower()} for {mpn}")
+						print(f"  > Old: {existing[k]}")
+						print(f"  > New: {new_value}")
+					existing[k] = new_value
+					updated = True
 
 			new_proj = list(new_part['Projects'])[0]
 			if new_proj not in existing['Projects']:
@@ -511,9 +616,11 @@ def main():
 		print("Error: Invalid directory path.")
 		return
 
-	master_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), MASTER_CSV_NAME)
+	script_dir = os.path.dirname(os.path.abspath(__file__))
+	master_path = os.path.join(script_dir, MASTER_CSV_NAME)
+	cache_path = os.path.join(script_dir, SHEET_CACHE_NAME)
 	master_data = load_master_csv(master_path)
-	new_data = scan_project_folder(folder_path)
+	new_data = scan_project_folder(folder_path, cache_path)
 
 	if not new_data:
 		print("No parts with MPNs found in this project.")
@@ -539,24 +646,19 @@ def main():
 	if confirm.lower() != 'y':
 		return
 
-	if os.path.exists(master_path):
-		backup_name = f"{MASTER_CSV_NAME}.bak"
-		shutil.copy(master_path, os.path.join(os.path.dirname(master_path), backup_name))
-		print(f"Backup created: {backup_name}")
-
 	# Sorting Logic: Type -> Value -> Voltage -> Footprint -> MPN
 	# Use numeric sorting for component types with parseable values, alphabetic for others
-	sorted_parts = sorted(
-		master_data.values(),
-		key=lambda x: (
-			x['Type'],
-			parse_value_to_float(x['Value']) if x['Type'] in VALUE_PARSE_TYPES else 0.0,
-			x['Value'] if x['Type'] not in VALUE_PARSE_TYPES else "",
-			parse_voltage_to_float(x['Voltage']),
-			x['Footprint'],
-			x['MPN']
-		)
-	)
+	# Build each part's key once, reading every field a single time
+	keyed_parts = []
+	for x in master_data.values():
+		if x['_is_parseable']:
+			value_num, value_text = parse_value_to_float(x['Value']), ""
+		else:
+			value_num, value_text = 0.0, x['Value']
+		sort_key = (x['Type'], value_num, value_text, parse_voltage_to_float(x['Voltage']), x['Footprint'], x['MPN'])
+		keyed_parts.append((sort_key, x))
+	keyed_parts.sort(key=itemgetter(0))
+	sorted_parts = [x for _, x in keyed_parts]
 
 	# Column order optimized for visibility and workflow
 	fieldnames = [
@@ -567,17 +669,29 @@ def main():
 		"Last Used", "Used In"
 	]
 
+	# Write to a temporary file first so a failed write never leaves a half-written master list
+	tmp_path = master_path + ".tmp"
 	try:
-		with open(master_path, 'w', newline='', encoding='utf-8') as csvfile:
-			writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-			writer.writeheader()
-			for part in sorted_parts:
-				row_data = part.copy()
-				row_data['Used In'] = ", ".join(sorted(part['Projects']))
-				del row_data['Projects']
-				writer.writerow(row_data)
+		with open(tmp_path, 'w', newline='', encoding='utf-8') as csvfile:
+			writer = csv.writer(csvfile)
+			writer.writerow(fieldnames)
+			# Every column except 'Used In' is stored on the part under its own name
+			get_part_fields = itemgetter(*fieldnames[:-1])
+			writer.writerows(
+				(*get_part_fields(part), ", ".join(sorted(part['Projects'])))
+				for part in sorted_parts
+			)
+
+		# Move the old list to the backup, then swap the new one in
+		if os.path.exists(master_path):
+			backup_name = f"{MASTER_CSV_NAME}.bak"
+			os.replace(master_path, os.path.join(os.path.dirname(master_path), backup_name))
+			print(f"Backup created: {backup_name}")
+		os.replace(tmp_path, master_path)
 		print("Success! Master list updated.")
 	except PermissionError:
+		if os.path.exists(tmp_path):
+			os.remove(tmp_path)
 		print("ERROR: Is 'master_parts.csv' open? Close it and try again.")
 
 if __name__ == "__main__":